@@ -0,0 +1,130 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Hot Tub Evaporation Model - compiled core
+
+Ahead-of-time compiled version of the evaporation math in
+hot_tub_evaporation.py, for callers that evaluate the model once per
+request and cannot afford NumPy dispatch or Numba's JIT warm-up.
+The formulas and coefficients are the same; see hot_tub_evaporation.py
+for how each factor is derived.
+
+Build in place with:
+    python setup.py build_ext --inplace
+"""
+
+from libc.math cimport exp
+
+# Antoine equation for water (valid 1-100°C): log10(P) = A - B/(C + T)
+cdef double _A = 8.07131
+cdef double _B = 1730.63
+cdef double _C = 233.426
+
+# °F to °C as one multiply-add: (F - 32) * 5/9 == F * 5/9 - 160/9
+cdef double _F2C_SCALE = 0.5555555555555556
+cdef double _F2C_OFFSET = -17.77777777777778
+
+# ln(10), so 10 ** x can be evaluated as exp(x * _LN10)
+cdef double _LN10 = 2.302585092994046
+
+# Order of the values in each result row (matches hot_tub_evaporation)
+RESULT_KEYS = (
+    'evap_inches_per_day',
+    'evap_gallons_per_day',
+    'industry_estimate_gallons',
+    'base_rate',
+    'wind_multiplier',
+    'agitation_multiplier',
+    'exposure_fraction',
+    'vp_deficit_mmhg'
+)
+
+cpdef double vapor_pressure_mmhg(double temp_f) noexcept nogil:
+    """Saturated vapor pressure in mmHg at temp_f (°F), via Antoine equation."""
+    return exp((_A - _B / (_C + temp_f * _F2C_SCALE + _F2C_OFFSET)) * _LN10)
+
+cdef void _evap_kernel(
+    double water_temp_f,
+    double air_temp_f,
+    double relative_humidity_percent,
+    double wind_speed_mph,
+    double surface_area_sqft,
+    double churn_area_percent,
+    double exposure_hours_per_day,
+    double* row
+) noexcept nogil:
+    """Evaluate one scenario, writing the results into row in RESULT_KEYS order."""
+    cdef double vp_deficit = (vapor_pressure_mmhg(water_temp_f) -
+                              vapor_pressure_mmhg(air_temp_f) * (relative_humidity_percent / 100))
+    cdef double base_evap_inches_per_day = 0.0018 * vp_deficit
+    cdef double wind_multiplier = 1 + (wind_speed_mph * 0.04)
+    cdef double churn_fraction = churn_area_percent / 100
+    cdef double agitation_multiplier = (1 - churn_fraction) + (churn_fraction * 2.0)
+    cdef double exposure_fraction = exposure_hours_per_day / 24
+    cdef double evap_rate_actual = (base_evap_inches_per_day * wind_multiplier *
+                                    agitation_multiplier * exposure_fraction)
+
+    row[0] = evap_rate_actual
+    row[1] = surface_area_sqft * (evap_rate_actual / 12) * 7.48
+    row[2] = (0.35 * wind_multiplier * agitation_multiplier *
+              exposure_fraction * surface_area_sqft / 12 * 7.48)
+    row[3] = base_evap_inches_per_day
+    row[4] = wind_multiplier
+    row[5] = agitation_multiplier
+    row[6] = exposure_fraction
+    row[7] = vp_deficit
+
+def calculate_evaporation_rate(
+    double water_temp_f,
+    double air_temp_f,
+    double relative_humidity_percent,
+    double wind_speed_mph,
+    double surface_area_sqft,
+    double churn_area_percent,
+    double exposure_hours_per_day
+):
+    """
+    Calculate hot tub evaporation for a single scenario.
+
+    Returns:
+        Dictionary with the same keys as
+        hot_tub_evaporation.calculate_evaporation_rate
+    """
+    cdef double row[8]
+    _evap_kernel(water_temp_f, air_temp_f, relative_humidity_percent,
+                 wind_speed_mph, surface_area_sqft, churn_area_percent,
+                 exposure_hours_per_day, row)
+    return {key: row[j] for j, key in enumerate(RESULT_KEYS)}
+
+def calculate_evaporation_rate_batch(
+    const double[::1] water_temp_f,
+    const double[::1] air_temp_f,
+    const double[::1] relative_humidity_percent,
+    const double[::1] wind_speed_mph,
+    const double[::1] surface_area_sqft,
+    const double[::1] churn_area_percent,
+    const double[::1] exposure_hours_per_day,
+    double[:, ::1] out
+):
+    """
+    Evaluate many scenarios from equal-length 1-D float64 arrays.
+
+    Results are written into out, an (n, len(RESULT_KEYS)) float64 array
+    (a hot_tub_evaporation.RESULT_DTYPE array viewed as float64 works).
+    The GIL is released for the loop, so other threads can run meanwhile.
+    """
+    cdef Py_ssize_t n = water_temp_f.shape[0]
+    cdef Py_ssize_t i
+
+    if out.shape[0] != n or out.shape[1] != len(RESULT_KEYS):
+        raise ValueError(f"out must have shape ({n}, {len(RESULT_KEYS)})")
+    if not (air_temp_f.shape[0] == relative_humidity_percent.shape[0] ==
+            wind_speed_mph.shape[0] == surface_area_sqft.shape[0] ==
+            churn_area_percent.shape[0] == exposure_hours_per_day.shape[0] == n):
+        raise ValueError("all input arrays must have the same length")
+
+    with nogil:
+        for i in range(n):
+            _evap_kernel(water_temp_f[i], air_temp_f[i],
+                         relative_humidity_percent[i], wind_speed_mph[i],
+                         surface_area_sqft[i], churn_area_percent[i],
+                         exposure_hours_per_day[i], &out[i, 0])
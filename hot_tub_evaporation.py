@@ -10,81 +10,84 @@ Estimates daily water loss from an outdoor hot tub based on:
 - Surface agitation from jets
 """
 
+import argparse
+import functools
 import math
+import sys
 
-def vapor_pressure_mmhg(temp_f):
-    """
-    Calculate saturated vapor pressure using Antoine equation.
+import numpy as np
+from numba import njit, prange
 
-    Args:
-        temp_f: Temperature in Fahrenheit
+# Antoine equation for water (valid 1-100°C): log10(P) = A - B/(C + T)
+_A, _B, _C = 8.07131, 1730.63, 233.426
 
-    Returns:
-        Vapor pressure in mmHg
-    """
-    # Convert to Celsius
-    temp_c = (temp_f - 32) * 5/9
+# °F to °C as one multiply-add: (F - 32) * 5/9 == F * 5/9 - 160/9
+_F2C_SCALE = 0.5555555555555556
+_F2C_OFFSET = -17.77777777777778
 
-    # Antoine equation for water (valid 1-100°C)
-    # log10(P) = A - B/(C + T)
-    A, B, C = 8.07131, 1730.63, 233.426
+# ln(10), so 10 ** x can be evaluated as exp(x * _LN10)
+_LN10 = 2.302585092994046
 
-    log_p = A - (B / (C + temp_c))
-    pressure_mmhg = 10 ** log_p
+# Order of the values returned by the evaporation kernels
+RESULT_KEYS = (
+    'evap_inches_per_day',
+    'evap_gallons_per_day',
+    'industry_estimate_gallons',
+    'base_rate',
+    'wind_multiplier',
+    'agitation_multiplier',
+    'exposure_fraction',
+    'vp_deficit_mmhg'
+)
 
-    return pressure_mmhg
+# Structured array layout for batch results, one float64 field per key
+RESULT_DTYPE = np.dtype([(key, np.float64) for key in RESULT_KEYS])
 
-def calculate_evaporation_rate(
-    water_temp_f,
-    air_temp_f,
-    relative_humidity_percent,
-    wind_speed_mph,
-    surface_area_sqft,
-    churn_area_percent,
-    exposure_hours_per_day
-):
+def _is_scalar(value):
+    """True for None and 0-d inputs; plain numbers skip the np.ndim call."""
+    return value is None or isinstance(value, (int, float)) or np.ndim(value) == 0
+
+def vapor_pressure_mmhg(temp_f):
     """
-    Calculate hot tub evaporation using modified pool evaporation formulas.
+    Calculate saturated vapor pressure using Antoine equation.
 
-    The model uses:
-    1. Vapor pressure gradient (water vs air)
-    2. Wind factor (increases boundary layer removal)
-    3. Agitation factor (jets churning increases effective evaporation)
-    4. Exposure time (covered vs uncovered)
+    Works element-wise, so a whole array of temperatures is evaluated
+    in one vectorized pass.
+
+    Args:
+        temp_f: Temperature in Fahrenheit (scalar or array)
 
     Returns:
-        Dictionary with evaporation estimates in gallons/day
+        Vapor pressure in mmHg, same shape as temp_f
     """
+    temp_f = np.asarray(temp_f, dtype=np.float64)
+    return np.exp((_A - _B / (_C + temp_f * _F2C_SCALE + _F2C_OFFSET)) * _LN10)
 
-    # Calculate vapor pressures
-    pw_water = vapor_pressure_mmhg(water_temp_f)  # Saturated VP at water surface
-    pw_air = vapor_pressure_mmhg(air_temp_f)       # Saturated VP at air temp
+def _air_vapor_pressures(air_temp_f, relative_humidity_percent):
+    """Return the (saturated, actual) vapor pressure in the air, in mmHg."""
+    pw_air = vapor_pressure_mmhg(air_temp_f)  # Saturated VP at air temp
 
     # Actual vapor pressure in air (accounting for humidity)
-    pa_air = pw_air * (relative_humidity_percent / 100)
+    pa_air = pw_air * (np.asarray(relative_humidity_percent) / 100)
 
-    # Vapor pressure deficit (driving force for evaporation)
-    vp_deficit = pw_water - pa_air  # mmHg
+    return pw_air, pa_air
 
-    print(f"\n--- Vapor Pressure Analysis ---")
-    print(f"Saturated VP at water surface ({water_temp_f}°F): {pw_water:.1f} mmHg")
-    print(f"Saturated VP in air ({air_temp_f}°F): {pw_air:.1f} mmHg")
-    print(f"Actual VP in air ({relative_humidity_percent}% RH): {pa_air:.1f} mmHg")
-    print(f"Vapor pressure deficit: {vp_deficit:.1f} mmHg")
-
-    # Base evaporation rate (still water, no wind)
-    # Using empirical formula: E = k × (Pw - Pa)
-    # where k ≈ 0.001 to 0.002 inches/day per mmHg for pools
-    # For hot water, using k = 0.0018
-    k_base = 0.0018  # inches per day per mmHg
-
-    base_evap_inches_per_day = k_base * vp_deficit
+@njit(cache=True, fastmath=True)
+def _vapor_pressure_kernel(temp_f):
+    """Scalar Antoine equation for the compiled kernels (see vapor_pressure_mmhg)."""
+    return math.exp((_A - _B / (_C + temp_f * _F2C_SCALE + _F2C_OFFSET)) * _LN10)
 
+@njit(cache=True, fastmath=True)
+def _wind_multiplier(wind_speed_mph):
+    """Evaporation multiplier for wind over the water surface."""
     # Wind factor - increases evaporation by removing humid boundary layer
     # Multiplier = 1 + (wind_speed_mph × 0.04)
     # This means 5 mph wind increases evaporation by ~20%, 10 mph by ~40%
-    wind_multiplier = 1 + (wind_speed_mph * 0.04)
+    return 1 + (wind_speed_mph * 0.04)
 
+@njit(cache=True, fastmath=True)
+def _agitation_multiplier(churn_area_percent):
+    """Evaporation multiplier for the share of the surface churned by jets."""
     # Agitation factor - jets churning the water
     # Split surface into churned and still portions
     churn_fraction = churn_area_percent / 100
@@ -96,7 +99,29 @@ def calculate_evaporation_rate(
     churn_multiplier = 2.0
 
     # Effective evaporation multiplier (weighted average)
-    agitation_multiplier = (still_fraction * 1.0) + (churn_fraction * churn_multiplier)
+    return (still_fraction * 1.0) + (churn_fraction * churn_multiplier)
+
+@njit(cache=True, fastmath=True)
+def _evap_from_factors(
+    vp_deficit,
+    wind_multiplier,
+    agitation_multiplier,
+    exposure_fraction,
+    surface_area_sqft
+):
+    """
+    Combine the vapor pressure deficit and the multipliers into one result.
+
+    Returns:
+        Tuple of floats in RESULT_KEYS order
+    """
+    # Base evaporation rate (still water, no wind)
+    # Using empirical formula: E = k × (Pw - Pa)
+    # where k ≈ 0.001 to 0.002 inches/day per mmHg for pools
+    # For hot water, using k = 0.0018
+    k_base = 0.0018  # inches per day per mmHg
+
+    base_evap_inches_per_day = k_base * vp_deficit
 
     # Combined evaporation rate (24-hour basis)
     evap_rate_full_day = (base_evap_inches_per_day *
@@ -104,7 +129,6 @@ def calculate_evaporation_rate(
                           agitation_multiplier)
 
     # Adjust for actual exposure time
-    exposure_fraction = exposure_hours_per_day / 24
     evap_rate_actual = evap_rate_full_day * exposure_fraction
 
     # Convert to volume loss
@@ -118,42 +142,458 @@ def calculate_evaporation_rate(
     industry_estimate = (industry_base * wind_multiplier * agitation_multiplier *
                         exposure_fraction * surface_area_sqft / 12 * 7.48)
 
-    return {
-        'evap_inches_per_day': evap_rate_actual,
-        'evap_gallons_per_day': volume_gallons,
-        'industry_estimate_gallons': industry_estimate,
-        'base_rate': base_evap_inches_per_day,
-        'wind_multiplier': wind_multiplier,
-        'agitation_multiplier': agitation_multiplier,
-        'exposure_fraction': exposure_fraction,
-        'vp_deficit_mmhg': vp_deficit
-    }
-
-def main():
-    print("=" * 60)
-    print("HOT TUB EVAPORATION CALCULATOR")
-    print("=" * 60)
-
-    # Get inputs from user
-    print("\n--- Hot Tub Specifications ---")
-    diameter_ft = float(input("Hot tub diameter (feet) [default: 12]: ") or "12")
-    water_temp = float(input("Water temperature (°F) [default: 102]: ") or "102")
-    exposure_hours = float(input("Hours exposed per day [default: 14]: ") or "14")
-
-    print("\n--- Environmental Conditions ---")
-    air_temp = float(input("Average air temperature (°F) [default: 70]: ") or "70")
-    humidity = float(input("Relative humidity (%) [default: 35]: ") or "35")
-    wind_speed = float(input("Average wind speed (mph) [default: 5]: ") or "5")
-
-    print("\n--- Jets/Agitation ---")
-    churn_percent = float(input("Percentage of surface area being churned by jets (0-100%) [default: 25]: ") or "25")
+    return (evap_rate_actual, volume_gallons, industry_estimate,
+            base_evap_inches_per_day, wind_multiplier, agitation_multiplier,
+            exposure_fraction, vp_deficit)
+
+@njit(cache=True, fastmath=True)
+def _evap_kernel(
+    pw_water_mmhg,
+    pa_air_mmhg,
+    wind_speed_mph,
+    surface_area_sqft,
+    churn_area_percent,
+    exposure_hours_per_day
+):
+    """
+    Pure-arithmetic core of the evaporation model for a single scenario.
+
+    Vapor pressures are inputs rather than being derived here, so callers
+    can evaluate the Antoine equation once per distinct temperature.
+
+    Returns:
+        Tuple of floats in RESULT_KEYS order
+    """
+    # Vapor pressure deficit (driving force for evaporation)
+    vp_deficit = pw_water_mmhg - pa_air_mmhg  # mmHg
+
+    return _evap_from_factors(
+        vp_deficit,
+        _wind_multiplier(wind_speed_mph),
+        _agitation_multiplier(churn_area_percent),
+        exposure_hours_per_day / 24,
+        surface_area_sqft
+    )
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _evap_kernel_vec(
+    pw_water_mmhg,
+    pa_air_mmhg,
+    wind_speed_mph,
+    surface_area_sqft,
+    churn_area_percent,
+    exposure_hours_per_day,
+    out
+):
+    """
+    Run _evap_kernel over equal-length 1-D arrays, one thread-parallel loop.
+
+    Results are written into out, an (n, len(RESULT_KEYS)) float64 array
+    with one row per scenario.
+    """
+    n = pw_water_mmhg.shape[0]
+    for i in prange(n):
+        row = _evap_kernel(pw_water_mmhg[i], pa_air_mmhg[i], wind_speed_mph[i],
+                           surface_area_sqft[i], churn_area_percent[i],
+                           exposure_hours_per_day[i])
+        for j in range(len(RESULT_KEYS)):
+            out[i, j] = row[j]
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _evap_sweep_kernel(
+    water_temp_f,
+    air_temp_f,
+    relative_humidity_percent,
+    wind_speed_mph,
+    surface_area_sqft,
+    churn_area_percent,
+    exposure_hours_per_day,
+    out
+):
+    """
+    Evaluate the model over the Cartesian product of seven 1-D axes.
+
+    Every factor that depends on a single input is computed once per axis
+    value; each grid point then looks its factors up by splitting its flat
+    (C-order) index into one index per axis. Results are written into out,
+    a (grid size, len(RESULT_KEYS)) float64 array.
+    """
+    n_water = water_temp_f.shape[0]
+    n_air = air_temp_f.shape[0]
+    n_rh = relative_humidity_percent.shape[0]
+    n_wind = wind_speed_mph.shape[0]
+    n_area = surface_area_sqft.shape[0]
+    n_churn = churn_area_percent.shape[0]
+    n_hours = exposure_hours_per_day.shape[0]
+
+    pw_water = np.empty(n_water)
+    for a in range(n_water):
+        pw_water[a] = _vapor_pressure_kernel(water_temp_f[a])
+    pw_air = np.empty(n_air)
+    for a in range(n_air):
+        pw_air[a] = _vapor_pressure_kernel(air_temp_f[a])
+    wind_multiplier = np.empty(n_wind)
+    for a in range(n_wind):
+        wind_multiplier[a] = _wind_multiplier(wind_speed_mph[a])
+    agitation_multiplier = np.empty(n_churn)
+    for a in range(n_churn):
+        agitation_multiplier[a] = _agitation_multiplier(churn_area_percent[a])
+    exposure_fraction = exposure_hours_per_day / 24
+
+    # C-order strides of each axis in the flat grid index
+    stride_churn = n_hours
+    stride_area = stride_churn * n_churn
+    stride_wind = stride_area * n_area
+    stride_rh = stride_wind * n_wind
+    stride_air = stride_rh * n_rh
+    stride_water = stride_air * n_air
+
+    for i in prange(out.shape[0]):
+        i_water = i // stride_water
+        i_air = (i // stride_air) % n_air
+        i_rh = (i // stride_rh) % n_rh
+        i_wind = (i // stride_wind) % n_wind
+        i_area = (i // stride_area) % n_area
+        i_churn = (i // stride_churn) % n_churn
+        i_hours = i % n_hours
+
+        # Actual vapor pressure in air (accounting for humidity)
+        pa_air = pw_air[i_air] * (relative_humidity_percent[i_rh] / 100)
+        row = _evap_from_factors(pw_water[i_water] - pa_air,
+                                 wind_multiplier[i_wind],
+                                 agitation_multiplier[i_churn],
+                                 exposure_fraction[i_hours],
+                                 surface_area_sqft[i_area])
+        for j in range(len(RESULT_KEYS)):
+            out[i, j] = row[j]
+
+def calculate_evaporation_rate_batch(
+    water_temp_f,
+    air_temp_f,
+    relative_humidity_percent,
+    wind_speed_mph,
+    surface_area_sqft,
+    churn_area_percent,
+    exposure_hours_per_day,
+    pa_air_mmhg=None,
+    pw_water_mmhg=None,
+    out=None
+):
+    """
+    Evaluate the evaporation model for many scenarios at once.
+
+    Inputs are scalars or NumPy arrays, broadcast together. Vapor pressures
+    are computed before broadcasting, once per supplied temperature. Results
+    are written straight into a structured array, so a sweep allocates one
+    block of memory instead of one dictionary per scenario.
+
+    Args:
+        pa_air_mmhg: Actual vapor pressure in the air, if already known (e.g.
+            from a dew-point reading). When given, air_temp_f and
+            relative_humidity_percent are not used.
+        pw_water_mmhg: Saturated vapor pressure at the water surface, if
+            already computed. When given, water_temp_f is not used.
+        out: Optional preallocated, C-contiguous array of RESULT_DTYPE shaped
+            like the broadcast inputs, to reuse across calls
+
+    Returns:
+        Structured array of RESULT_DTYPE, shaped like the broadcast inputs
+    """
+    if pw_water_mmhg is None:
+        pw_water_mmhg = vapor_pressure_mmhg(water_temp_f)  # Saturated VP at water surface
+
+    if pa_air_mmhg is None:
+        _, pa_air_mmhg = _air_vapor_pressures(air_temp_f, relative_humidity_percent)
+
+    inputs = [np.asarray(value, dtype=np.float64) for value in (
+        pw_water_mmhg,
+        pa_air_mmhg,
+        wind_speed_mph,
+        surface_area_sqft,
+        churn_area_percent,
+        exposure_hours_per_day
+    )]
+    shape = np.broadcast_shapes(*(value.shape for value in inputs))
+
+    if out is None:
+        out = np.empty(shape, dtype=RESULT_DTYPE)
+    elif out.dtype != RESULT_DTYPE or out.shape != shape or not out.flags.c_contiguous:
+        raise ValueError(f"out must be a C-contiguous {shape} array of RESULT_DTYPE")
+
+    # View the records as a plain (n, fields) float64 matrix for the kernel
+    columns = out.reshape(-1).view(np.float64).reshape(-1, len(RESULT_KEYS))
+    # The kernel wants equal-length 1-D arrays, so any input that needs
+    # broadcasting is expanded into its own contiguous full-size copy
+    _evap_kernel_vec(*(
+        np.ascontiguousarray(
+            value if value.shape == shape else np.broadcast_to(value, shape).copy()
+        ).reshape(-1)
+        for value in inputs
+    ), columns)
+
+    return out
+
+def calculate_evaporation_rate(
+    water_temp_f,
+    air_temp_f,
+    relative_humidity_percent,
+    wind_speed_mph,
+    surface_area_sqft,
+    churn_area_percent,
+    exposure_hours_per_day,
+    pa_air_mmhg=None,
+    verbose=False
+):
+    """
+    Calculate hot tub evaporation using modified pool evaporation formulas.
+
+    The model uses:
+    1. Vapor pressure gradient (water vs air)
+    2. Wind factor (increases boundary layer removal)
+    3. Agitation factor (jets churning increases effective evaporation)
+    4. Exposure time (covered vs uncovered)
+
+    All inputs may be scalars or NumPy arrays (broadcast together), so a
+    parameter sweep can be evaluated in a single call. Scalar inputs call
+    the compiled _evap_kernel directly; array inputs run through
+    calculate_evaporation_rate_batch, which can also be used directly to
+    get a structured array instead of a dictionary.
+
+    Args:
+        pa_air_mmhg: Actual vapor pressure in the air, if already known (e.g.
+            from a dew-point reading). When given, air_temp_f and
+            relative_humidity_percent are not used.
+        verbose: Print the vapor pressure breakdown (scalar inputs only)
+
+    Returns:
+        Dictionary with evaporation estimates in gallons/day; values are
+        floats for scalar inputs and arrays for array inputs
+
+    Raises:
+        ValueError: If verbose is set and any input is an array
+    """
+    scalar = all(_is_scalar(value) for value in (
+        water_temp_f,
+        air_temp_f,
+        relative_humidity_percent,
+        wind_speed_mph,
+        surface_area_sqft,
+        churn_area_percent,
+        exposure_hours_per_day,
+        pa_air_mmhg
+    ))
+    if verbose and not scalar:
+        raise ValueError("verbose output is only supported for scalar inputs")
+
+    if scalar:
+        # One scenario: skip the array machinery and call the kernel directly
+        pw_water = _vapor_pressure_kernel(float(water_temp_f))  # Saturated VP at water surface
+
+        pw_air = None
+        if pa_air_mmhg is None:
+            pw_air = _vapor_pressure_kernel(float(air_temp_f))  # Saturated VP at air temp
+
+            # Actual vapor pressure in air (accounting for humidity)
+            pa_air_mmhg = pw_air * (relative_humidity_percent / 100)
+
+        results = dict(zip(RESULT_KEYS, _evap_kernel(
+            pw_water,
+            float(pa_air_mmhg),
+            float(wind_speed_mph),
+            float(surface_area_sqft),
+            float(churn_area_percent),
+            float(exposure_hours_per_day)
+        )))
+    else:
+        pw_water = vapor_pressure_mmhg(water_temp_f)  # Saturated VP at water surface
+
+        if pa_air_mmhg is None:
+            _, pa_air_mmhg = _air_vapor_pressures(air_temp_f, relative_humidity_percent)
+
+        batch = calculate_evaporation_rate_batch(
+            water_temp_f,
+            air_temp_f,
+            relative_humidity_percent,
+            wind_speed_mph,
+            surface_area_sqft,
+            churn_area_percent,
+            exposure_hours_per_day,
+            pa_air_mmhg=pa_air_mmhg,
+            pw_water_mmhg=pw_water
+        )
+        results = {key: batch[key] for key in RESULT_KEYS}
+
+    if verbose:
+        # Build the whole block and write it once
+        lines = [
+            "\n--- Vapor Pressure Analysis ---",
+            f"Saturated VP at water surface ({water_temp_f}°F): {pw_water:.1f} mmHg"
+        ]
+        if pw_air is not None:
+            lines.append(f"Saturated VP in air ({air_temp_f}°F): {pw_air:.1f} mmHg")
+            lines.append(f"Actual VP in air ({relative_humidity_percent}% RH): {pa_air_mmhg:.1f} mmHg")
+        else:
+            lines.append(f"Actual VP in air: {pa_air_mmhg:.1f} mmHg")
+        lines.append(f"Vapor pressure deficit: {results['vp_deficit_mmhg']:.1f} mmHg")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    return results
+
+def evaporation_sweep(
+    water_temp_f,
+    air_temp_f,
+    relative_humidity_percent,
+    wind_speed_mph,
+    surface_area_sqft,
+    churn_area_percent,
+    exposure_hours_per_day,
+    out=None
+):
+    """
+    Evaluate the evaporation model over a Cartesian grid of inputs.
+
+    Each argument is a scalar or a 1-D array of values. Every array argument
+    becomes one axis of the grid, in argument order; scalars are held fixed.
+    Vapor pressures, wind, agitation and exposure factors are computed once
+    per axis value rather than once per grid point, and the inputs are never
+    expanded to the grid, so the result array is the only grid-sized
+    allocation.
+
+    Args:
+        out: Optional preallocated array of RESULT_DTYPE with the grid shape
+
+    Returns:
+        Structured array of RESULT_DTYPE with one axis per array argument
+    """
+    values = [np.asarray(value, dtype=np.float64) for value in (
+        water_temp_f,
+        air_temp_f,
+        relative_humidity_percent,
+        wind_speed_mph,
+        surface_area_sqft,
+        churn_area_percent,
+        exposure_hours_per_day
+    )]
+    if any(value.ndim > 1 for value in values):
+        raise ValueError("evaporation_sweep inputs must be scalars or 1-D arrays")
+
+    # Each array is one axis of the grid; scalars are length-1 axes that
+    # the kernel indexes like any other but that do not appear in the shape
+    shape = tuple(value.size for value in values if value.ndim == 1)
+
+    if out is None:
+        out = np.empty(shape, dtype=RESULT_DTYPE)
+    elif out.dtype != RESULT_DTYPE or out.shape != shape or not out.flags.c_contiguous:
+        raise ValueError(f"out must be a C-contiguous {shape} array of RESULT_DTYPE")
+
+    # View the records as a plain (n, fields) float64 matrix for the kernel
+    columns = out.reshape(-1).view(np.float64).reshape(-1, len(RESULT_KEYS))
+    _evap_sweep_kernel(*(np.ascontiguousarray(value).reshape(-1) for value in values),
+                       columns)
+
+    return out
+
+@functools.lru_cache(maxsize=32)
+def make_evap_kernel(surface_area_sqft, churn_area_percent, exposure_hours_per_day):
+    """
+    Build a compiled gallons/day function specialized to one hot tub.
+
+    For sweeps where only the weather varies, the geometry-dependent factors
+    (agitation, exposure, area and unit conversions) are folded into a
+    single constant before compilation. Kernels are memoized per geometry
+    in-process only; they are not written to Numba's on-disk cache, which
+    would otherwise gain a file for every geometry ever used.
+
+    Returns:
+        Function f(water_temp_f, air_temp_f, relative_humidity_percent,
+        wind_speed_mph) giving evap_gallons_per_day, same model as
+        calculate_evaporation_rate
+    """
+    churn_fraction = churn_area_percent / 100
+    agitation_multiplier = (1 - churn_fraction) + churn_fraction * 2.0
+    exposure_fraction = exposure_hours_per_day / 24
+    # k_base × agitation × exposure × area × (inches -> feet -> gallons)
+    gallons_per_mmhg = (0.0018 * agitation_multiplier * exposure_fraction *
+                        surface_area_sqft / 12 * 7.48)
+
+    @njit(fastmath=True)
+    def evap_gallons_per_day(water_temp_f, air_temp_f, relative_humidity_percent,
+                             wind_speed_mph):
+        vp_deficit = (_vapor_pressure_kernel(water_temp_f) -
+                      _vapor_pressure_kernel(air_temp_f) * relative_humidity_percent * 0.01)
+        return gallons_per_mmhg * vp_deficit * (1 + wind_speed_mph * 0.04)
+
+    return evap_gallons_per_day
+
+def main(argv=None):
+    """
+    Run the calculator.
+
+    With no command-line arguments the inputs are prompted for
+    interactively. If any option is given, no prompts are shown and
+    omitted options take their defaults, so the script can be scripted.
+
+    Args:
+        argv: Argument list to parse instead of sys.argv[1:]
+    """
+    parser = argparse.ArgumentParser(
+        description="Estimate daily water loss from an outdoor hot tub."
+    )
+    parser.add_argument('--diameter', type=float, default=12.0,
+                        help="hot tub diameter in feet (default: 12)")
+    parser.add_argument('--water-temp', type=float, default=102.0,
+                        help="water temperature in °F (default: 102)")
+    parser.add_argument('--exposure-hours', type=float, default=14.0,
+                        help="hours exposed per day (default: 14)")
+    parser.add_argument('--air-temp', type=float, default=70.0,
+                        help="average air temperature in °F (default: 70)")
+    parser.add_argument('--humidity', type=float, default=35.0,
+                        help="relative humidity in %% (default: 35)")
+    parser.add_argument('--wind-speed', type=float, default=5.0,
+                        help="average wind speed in mph (default: 5)")
+    parser.add_argument('--churn', type=float, default=25.0,
+                        help="percent of surface churned by jets (default: 25)")
+    if argv is None:
+        argv = sys.argv[1:]
+    args = parser.parse_args(argv)
+
+    sys.stdout.write(
+        "=" * 60 + "\n"
+        "HOT TUB EVAPORATION CALCULATOR\n"
+        + "=" * 60 + "\n"
+    )
+
+    if argv:
+        diameter_ft = args.diameter
+        water_temp = args.water_temp
+        exposure_hours = args.exposure_hours
+        air_temp = args.air_temp
+        humidity = args.humidity
+        wind_speed = args.wind_speed
+        churn_percent = args.churn
+    else:
+        # Get inputs from user
+        print("\n--- Hot Tub Specifications ---")
+        diameter_ft = float(input("Hot tub diameter (feet) [default: 12]: ") or "12")
+        water_temp = float(input("Water temperature (°F) [default: 102]: ") or "102")
+        exposure_hours = float(input("Hours exposed per day [default: 14]: ") or "14")
+
+        print("\n--- Environmental Conditions ---")
+        air_temp = float(input("Average air temperature (°F) [default: 70]: ") or "70")
+        humidity = float(input("Relative humidity (%) [default: 35]: ") or "35")
+        wind_speed = float(input("Average wind speed (mph) [default: 5]: ") or "5")
+
+        print("\n--- Jets/Agitation ---")
+        churn_percent = float(input("Percentage of surface area being churned by jets (0-100%) [default: 25]: ") or "25")
 
     # Calculate surface area
     radius_ft = diameter_ft / 2
-    surface_area = math.pi * radius_ft ** 2
+    surface_area = math.pi * radius_ft * radius_ft
 
-    print(f"\n--- Calculated Surface Area ---")
-    print(f"Surface area: {surface_area:.1f} square feet")
+    sys.stdout.write(
+        f"\n--- Calculated Surface Area ---\n"
+        f"Surface area: {surface_area:.1f} square feet\n"
+    )
 
     # Run the model
     results = calculate_evaporation_rate(
@@ -163,44 +603,49 @@ def main():
         wind_speed_mph=wind_speed,
         surface_area_sqft=surface_area,
         churn_area_percent=churn_percent,
-        exposure_hours_per_day=exposure_hours
+        exposure_hours_per_day=exposure_hours,
+        verbose=True
     )
 
-    # Display results
-    print("\n" + "=" * 60)
-    print("EVAPORATION MODEL RESULTS")
-    print("=" * 60)
-
-    print(f"\n--- Multipliers ---")
-    print(f"Wind multiplier: {results['wind_multiplier']:.2f}x")
-    print(f"Agitation multiplier: {results['agitation_multiplier']:.2f}x")
-    print(f"Exposure time factor: {results['exposure_fraction']:.2f}x ({exposure_hours} hrs/day)")
-
-    print(f"\n--- Water Loss Estimates ---")
-    print(f"Base evaporation rate: {results['base_rate']:.3f} inches/day")
-    print(f"Actual evaporation rate: {results['evap_inches_per_day']:.3f} inches/day")
-    print(f"\n💧 ESTIMATED DAILY WATER LOSS: {results['evap_gallons_per_day']:.1f} gallons/day")
-    print(f"   (Industry rule-of-thumb estimate: {results['industry_estimate_gallons']:.1f} gallons/day)")
-
-    # Additional insights
-    print(f"\n--- Additional Insights ---")
     weekly_loss = results['evap_gallons_per_day'] * 7
     monthly_loss = results['evap_gallons_per_day'] * 30
-    print(f"Weekly water loss: ~{weekly_loss:.0f} gallons")
-    print(f"Monthly water loss: ~{monthly_loss:.0f} gallons")
 
     # Calculate water depth loss
     depth_loss_per_day = results['evap_inches_per_day']
     days_to_lose_one_inch = 1 / depth_loss_per_day if depth_loss_per_day > 0 else float('inf')
-    print(f"Water level drops {depth_loss_per_day:.3f} inches per day ({days_to_lose_one_inch:.1f} days per inch)")
-
-    print("\n" + "=" * 60)
-    print("SENSITIVITY NOTES:")
-    print("- Doubling wind speed increases loss by ~20-40%")
-    print("- Each 10°F increase in water temp adds ~15-25% loss")
-    print("- Each 10% drop in humidity adds ~10-15% loss")
-    print("- Aggressive jets (50% churn) can add 25-50% to loss")
-    print("=" * 60)
+
+    # Display results, built as one buffer and written once
+    lines = [
+        "\n" + "=" * 60,
+        "EVAPORATION MODEL RESULTS",
+        "=" * 60,
+
+        f"\n--- Multipliers ---",
+        f"Wind multiplier: {results['wind_multiplier']:.2f}x",
+        f"Agitation multiplier: {results['agitation_multiplier']:.2f}x",
+        f"Exposure time factor: {results['exposure_fraction']:.2f}x ({exposure_hours} hrs/day)",
+
+        f"\n--- Water Loss Estimates ---",
+        f"Base evaporation rate: {results['base_rate']:.3f} inches/day",
+        f"Actual evaporation rate: {results['evap_inches_per_day']:.3f} inches/day",
+        f"\n💧 ESTIMATED DAILY WATER LOSS: {results['evap_gallons_per_day']:.1f} gallons/day",
+        f"   (Industry rule-of-thumb estimate: {results['industry_estimate_gallons']:.1f} gallons/day)",
+
+        # Additional insights
+        f"\n--- Additional Insights ---",
+        f"Weekly water loss: ~{weekly_loss:.0f} gallons",
+        f"Monthly water loss: ~{monthly_loss:.0f} gallons",
+        f"Water level drops {depth_loss_per_day:.3f} inches per day ({days_to_lose_one_inch:.1f} days per inch)",
+
+        "\n" + "=" * 60,
+        "SENSITIVITY NOTES:",
+        "- Doubling wind speed increases loss by ~20-40%",
+        "- Each 10°F increase in water temp adds ~15-25% loss",
+        "- Each 10% drop in humidity adds ~10-15% loss",
+        "- Aggressive jets (50% churn) can add 25-50% to loss",
+        "=" * 60
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     main()
@@ -1,8 +1,14 @@
 """
 List Comprehensions Demo
-Demonstrates various ways to use list comprehensions in Python
+Demonstrates various ways to use list comprehensions in Python,
+each followed by its NumPy vectorized equivalent
 """
 
+import sys
+from array import array
+
+import numpy as np
+
 
 def main():
     print("=" * 60)
@@ -12,20 +18,24 @@ def main():
     # 1. Basic list comprehension
     print("\n1. Basic List Comprehension")
     print("-" * 40)
-    squares = [x**2 for x in range(10)]
+    squares = [x * x for x in range(10)]
     print(f"Squares of 0-9: {squares}")
+    print(f"NumPy equivalent: {np.arange(10) ** 2}")
 
     # 2. List comprehension with conditional (filter)
     print("\n2. List Comprehension with Conditional")
     print("-" * 40)
     evens = [x for x in range(20) if x % 2 == 0]
     print(f"Even numbers 0-19: {evens}")
+    print(f"NumPy equivalent: {np.arange(0, 20, 2)}")
 
     # 3. List comprehension with if-else (mapping)
     print("\n3. List Comprehension with If-Else")
     print("-" * 40)
     labels = ["Even" if x % 2 == 0 else "Odd" for x in range(10)]
     print(f"Even/Odd labels for 0-9: {labels}")
+    arr = np.arange(10)
+    print(f"NumPy equivalent: {np.where(arr % 2 == 0, 'Even', 'Odd')}")
 
     # 4. List comprehension with string manipulation
     print("\n4. String Manipulation")
@@ -34,6 +44,7 @@ def main():
     uppercase = [word.upper() for word in words]
     print(f"Original: {words}")
     print(f"Uppercase: {uppercase}")
+    print(f"NumPy equivalent: {np.char.upper(words)}")
 
     # 5. List comprehension with function calls
     print("\n5. Using Functions in List Comprehension")
@@ -43,6 +54,7 @@ def main():
 
     doubled = [double(x) for x in range(5)]
     print(f"Doubled values: {doubled}")
+    print(f"NumPy equivalent: {np.arange(5) * 2}")
 
     # 6. Nested list comprehension (2D list)
     print("\n6. Nested List Comprehension")
@@ -51,6 +63,8 @@ def main():
     print("Multiplication table (3x3):")
     for row in matrix:
         print(row)
+    print("NumPy equivalent (outer product):")
+    print(np.outer(np.arange(1, 4), np.arange(1, 4)))
 
     # 7. Flattening a 2D list
     print("\n7. Flattening a 2D List")
@@ -59,26 +73,33 @@ def main():
     flattened = [num for row in nested for num in row]
     print(f"Nested: {nested}")
     print(f"Flattened: {flattened}")
+    print(f"NumPy equivalent: {np.array(nested).ravel()}")
 
     # 8. List comprehension with multiple conditions
     print("\n8. Multiple Conditions")
     print("-" * 40)
     divisible = [x for x in range(50) if x % 3 == 0 and x % 5 == 0]
     print(f"Numbers divisible by both 3 and 5 (0-49): {divisible}")
+    print(f"NumPy equivalent: {np.arange(0, 50, 15)}")
 
     # 9. Working with tuples
     print("\n9. Working with Tuples")
     print("-" * 40)
-    pairs = [(x, x**2) for x in range(5)]
+    pairs = [(x, x * x) for x in range(5)]
     print(f"Number and square pairs: {pairs}")
+    arr = np.arange(5)
+    print("NumPy equivalent (one row per pair):")
+    print(np.column_stack((arr, arr * arr)))
 
     # 10. Filtering and transforming
     print("\n10. Filter and Transform Combined")
     print("-" * 40)
     numbers = [1, -2, 3, -4, 5, -6, 7, -8]
-    positive_squares = [x**2 for x in numbers if x > 0]
+    positive_squares = [x * x for x in numbers if x > 0]
     print(f"Original: {numbers}")
     print(f"Squares of positive numbers: {positive_squares}")
+    arr = np.array(numbers)
+    print(f"NumPy equivalent: {arr[arr > 0] ** 2}")
 
     # Comparison: List comprehension vs traditional loop
     print("\n" + "=" * 60)
@@ -89,14 +110,34 @@ def main():
     traditional = []
     for x in range(5):
         if x % 2 == 0:
-            traditional.append(x**2)
+            traditional.append(x * x)
 
     # List comprehension way
-    comprehension = [x**2 for x in range(5) if x % 2 == 0]
+    comprehension = [x * x for x in range(5) if x % 2 == 0]
 
     print("\nTraditional loop result:", traditional)
     print("List comprehension result:", comprehension)
     print("\nBoth produce the same result, but list comprehension is more concise!")
+    print("For large numeric data, the NumPy forms above run each operation as a")
+    print("single loop in C instead of one Python-level step per element.")
+
+    # Memory: a list holds a pointer to a separate int object per element,
+    # while array.array and NumPy store the raw 8-byte values contiguously
+    print("\n" + "=" * 60)
+    print("MEMORY: List vs Typed Arrays")
+    print("=" * 60)
+
+    # Reuse the squares list from example 1
+    squares_array = array('q', squares)
+    squares_np = np.arange(10) ** 2
+    list_bytes = sys.getsizeof(squares) + sum(sys.getsizeof(x) for x in squares)
+
+    print(f"\nList of {len(squares)} ints: ~{list_bytes} bytes "
+          f"(8-byte pointer + ~28-byte int object per element)")
+    print(f"array.array('q'): {squares_array.itemsize * len(squares_array)} bytes of data "
+          f"({squares_array.itemsize} bytes per element)")
+    print(f"NumPy {squares_np.dtype} array: {squares_np.nbytes} bytes of data "
+          f"({squares_np.itemsize} bytes per element)")
 
 
 if __name__ == "__main__":
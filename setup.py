@@ -0,0 +1,26 @@
+"""
+Build script for the compiled hot tub evaporation core (hot_tub_evap.pyx).
+
+    python setup.py build_ext --inplace
+
+Build requirements (setuptools, Cython 3) are declared in pyproject.toml, so
+`pip wheel .` installs them automatically. For an in-place build, install
+them first: pip install "setuptools>=61" "Cython>=3.0"
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    name="hot-tub-evap",
+    ext_modules=cythonize(
+        [
+            Extension(
+                "hot_tub_evap",
+                ["hot_tub_evap.pyx"],
+                extra_compile_args=["-O3"],
+            )
+        ],
+        compiler_directives={"language_level": "3"},
+    ),
+)
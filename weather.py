@@ -4,11 +4,17 @@ Simple Weather App
 A command-line weather application that fetches current weather data using OpenWeatherMap API.
 """
 
+import argparse
+import asyncio
 import os
 import sys
-import requests
-from datetime import datetime
+import time
+from urllib.parse import urlencode
+import httpx
+import orjson
+import urllib3
 from dotenv import load_dotenv
+from urllib3.util.retry import Retry
 
 # Load environment variables from .env file
 load_dotenv()
@@ -16,7 +22,11 @@ load_dotenv()
 class WeatherApp:
     """Main Weather Application class"""
 
+    __slots__ = ('api_key', '_cache', '_params', '_url_prefix', '_http')
+
     BASE_URL = "http://api.openweathermap.org/data/2.5/weather"
+    CACHE_TTL_SECONDS = 600  # OpenWeatherMap updates current weather ~every 10 min
+    CACHE_MAX_ENTRIES = 128
 
     def __init__(self):
         """Initialize the weather app with API key"""
@@ -25,37 +35,109 @@ class WeatherApp:
             print("Error: OPENWEATHER_API_KEY not found in environment variables.")
             print("Please create a .env file with your API key.")
             sys.exit(1)
+        self._cache = {}  # normalized city -> (fetch time, weather data)
+
+        self._params = {
+            'appid': self.api_key,
+            'units': 'metric'  # Use metric units (Celsius)
+        }
+        # Fixed part of the request URL, built once; only the city varies
+        self._url_prefix = f"{self.BASE_URL}?{urlencode(self._params)}"
+
+        # One connection pool for the whole run, so the connection is kept
+        # alive and reused between lookups instead of reconnecting per city
+        self._http = urllib3.PoolManager(
+            num_pools=2,
+            maxsize=8,
+            timeout=10,
+            retries=Retry(total=3, backoff_factor=0.3)
+        )
 
     def get_weather(self, city):
         """
         Fetch weather data for a given city
 
+        Responses are cached per city for CACHE_TTL_SECONDS, so repeating
+        a query within a session does not hit the network again.
+
         Args:
             city (str): Name of the city
 
         Returns:
             dict: Weather data or None if request fails
         """
-        params = {
-            'q': city,
-            'appid': self.api_key,
-            'units': 'metric'  # Use metric units (Celsius)
-        }
+        key = city.lower().strip()
+        cached = self._get_cached(key)
+        if cached:
+            return cached
+
+        url = f"{self._url_prefix}&{urlencode({'q': city})}"
+        try:
+            response = self._http.request('GET', url)
+            if response.status == 404:
+                print(f"Error: City '{city}' not found.")
+                return None
+            if response.status >= 400:
+                print(f"HTTP Error: {response.status} {response.reason}")
+                return None
+            weather_data = orjson.loads(response.data)
+        except (urllib3.exceptions.HTTPError, orjson.JSONDecodeError) as e:
+            print(f"Error fetching weather data: {e}")
+            return None
+
+        self._store_cached(key, weather_data)
+        return weather_data
+
+    async def get_weather_async(self, client, city):
+        """
+        Fetch weather data for a given city without blocking the event loop
+
+        Shares the response cache with get_weather.
+
+        Args:
+            client (httpx.AsyncClient): Client carrying the default params
+            city (str): Name of the city
+
+        Returns:
+            dict: Weather data or None if request fails
+        """
+        key = city.lower().strip()
+        cached = self._get_cached(key)
+        if cached:
+            return cached
 
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = await client.get(self.BASE_URL, params={'q': city})
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 404:
+            weather_data = orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
                 print(f"Error: City '{city}' not found.")
             else:
-                print(f"HTTP Error: {e}")
+                print(f"HTTP Error: {e.response.status_code} {e.response.reason_phrase}")
             return None
-        except requests.exceptions.RequestException as e:
+        except (httpx.RequestError, orjson.JSONDecodeError) as e:
             print(f"Error fetching weather data: {e}")
             return None
 
+        self._store_cached(key, weather_data)
+        return weather_data
+
+    def _get_cached(self, key):
+        """Return cached weather data for key, or None if missing or expired"""
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL_SECONDS:
+            return cached[1]
+        return None
+
+    def _store_cached(self, key, weather_data):
+        """Cache weather data for key, evicting the oldest entry when full"""
+        self._cache.pop(key, None)  # re-insert refreshed entries as newest
+        if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (time.monotonic(), weather_data)
+
     def display_weather(self, weather_data):
         """
         Display formatted weather information
@@ -68,27 +150,32 @@ class WeatherApp:
 
         city = weather_data['name']
         country = weather_data['sys']['country']
-        temp = weather_data['main']['temp']
-        feels_like = weather_data['main']['feels_like']
-        humidity = weather_data['main']['humidity']
-        pressure = weather_data['main']['pressure']
-        description = weather_data['weather'][0]['description'].capitalize()
+        main_data = weather_data['main']
+        temp, feels_like, humidity, pressure = (
+            main_data['temp'], main_data['feels_like'],
+            main_data['humidity'], main_data['pressure']
+        )
+        condition = weather_data['weather'][0]
+        description = condition['description'].capitalize()
         wind_speed = weather_data['wind']['speed']
 
         # Convert timestamp to readable format
         timestamp = weather_data['dt']
-        time = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
-
-        print("\n" + "="*50)
-        print(f"Weather in {city}, {country}")
-        print("="*50)
-        print(f"Time: {time}")
-        print(f"Condition: {description}")
-        print(f"Temperature: {temp}°C (Feels like {feels_like}°C)")
-        print(f"Humidity: {humidity}%")
-        print(f"Pressure: {pressure} hPa")
-        print(f"Wind Speed: {wind_speed} m/s")
-        print("="*50 + "\n")
+        time_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+        # Build the report as one string so it is written in a single call
+        sys.stdout.write(
+            "\n" + "="*50 + "\n"
+            f"Weather in {city}, {country}\n"
+            + "="*50 + "\n"
+            f"Time: {time_str}\n"
+            f"Condition: {description}\n"
+            f"Temperature: {temp}°C (Feels like {feels_like}°C)\n"
+            f"Humidity: {humidity}%\n"
+            f"Pressure: {pressure} hPa\n"
+            f"Wind Speed: {wind_speed} m/s\n"
+            + "="*50 + "\n\n"
+        )
 
     def run(self):
         """Main application loop"""
@@ -109,11 +196,51 @@ class WeatherApp:
             weather_data = self.get_weather(city)
             self.display_weather(weather_data)
 
+    async def run_batch(self, cities):
+        """
+        Fetch weather for many cities concurrently
+
+        Args:
+            cities (list): City names
+
+        Returns:
+            list: Weather data (or None) for each city, in input order
+        """
+        async with httpx.AsyncClient(
+            params=self._params,
+            timeout=10,
+            limits=httpx.Limits(max_connections=10)
+        ) as client:
+            return await asyncio.gather(
+                *(self.get_weather_async(client, city) for city in cities)
+            )
+
 
 def main():
     """Entry point of the application"""
+    parser = argparse.ArgumentParser(description="Show current weather for cities.")
+    parser.add_argument(
+        '--batch',
+        metavar='FILE',
+        help="look up every city listed in FILE (one per line) and exit"
+    )
+    args = parser.parse_args()
+
+    cities = None
+    if args.batch:
+        try:
+            with open(args.batch) as f:
+                cities = [line.strip() for line in f if line.strip()]
+        except OSError as e:
+            print(f"Error reading city list: {e}")
+            sys.exit(1)
+
     app = WeatherApp()
-    app.run()
+    if cities is not None:
+        for weather_data in asyncio.run(app.run_batch(cities)):
+            app.display_weather(weather_data)
+    else:
+        app.run()
 
 
 if __name__ == "__main__":